@@ -0,0 +1,77 @@
+/*
+ * github.com/greigdp, 2016
+ *
+ * The same depth-first search as dfs in main.py, in C, for loading with ctypes. Build it next to main.py with:
+ *
+ *     cc -O2 -shared -fPIC -o enumerate.so enumerate.c
+ *
+ * The rules aren't repeated here - main.py passes in its NEXT table, where next[last * 512 + mask] is the bitmask of
+ * dots permitted to feature after last, given the visited-dots bitmask.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+/* Patterns must be a minimum of 4 dots in length */
+#define MIN_LENGTH 4
+
+struct search {
+    const uint16_t *next;
+    int max_length;
+    char path[9];
+    size_t *counts;  /* number of patterns found of each length */
+    char *out[10];   /* where the next pattern of each length is written, or NULL when only counting */
+};
+
+static void dfs(struct search *s, int last, unsigned mask, int depth)
+{
+    if (depth >= MIN_LENGTH) {
+        s->counts[depth]++;
+        if (s->out[depth]) {
+            for (int i = 0; i < depth; i++)
+                *s->out[depth]++ = s->path[i];
+            *s->out[depth]++ = '\n';
+        }
+    }
+    if (depth == s->max_length)
+        return;
+    for (unsigned allowed = s->next[last * 512 + mask]; allowed; allowed &= allowed - 1) {
+        int nxt = __builtin_ctz(allowed);
+        s->path[depth] = '0' + nxt;
+        dfs(s, nxt, mask | (1u << nxt), depth + 1);
+    }
+}
+
+static void search_all(struct search *s)
+{
+    for (int i = 0; i < 10; i++)
+        s->counts[i] = 0;
+    for (int start = 0; start < 9; start++) {
+        s->path[0] = '0' + start;
+        dfs(s, start, 1u << start, 1);
+    }
+}
+
+/*
+ * Writes every valid pattern of 4 up to max_length dots to out as new-line separated ASCII, shortest first and in order
+ * within each length, and fills counts[length] (which must have 10 entries). The search is run once to count the
+ * patterns of each length, so that the second run can write each length straight into its own part of out.
+ * Returns the number of bytes written, or (size_t)-1 if max_length isn't between 1 and 9 - path, counts and out only
+ * have room for 9 dots.
+ */
+size_t enumerate_patterns(const uint16_t *next, int max_length, char *out, size_t *counts)
+{
+    if (max_length < 1 || max_length > 9)
+        return (size_t)-1;
+
+    struct search s = { .next = next, .max_length = max_length, .counts = counts };
+
+    search_all(&s);
+    size_t size = 0;
+    for (int i = MIN_LENGTH; i <= max_length; i++) {
+        s.out[i] = out + size;
+        size += counts[i] * (i + 1);
+    }
+    search_all(&s);
+    return size;
+}
@@ -14,13 +14,23 @@ The Android pattern grid is as follows:
 
 A pattern is just an array which can be appended to, until a pattern is formed.
 
-Also note that this is not a particularly elegant or neat solution. For example, getAdjacent, getLinear and getEndLinear
-could be considered as sets, since getLinear is the union of getAdjacent and getEndLinear, and getAdjacent and
-getEndLinear are mutually exclusive.
+The rules are held as 9-bit masks built once at import time: ENDLIN_MASK (the non-adjacent dots in a line with each
+dot), DIRECT_MASK (every dot that can be reached without passing over another) and MIDDLE_BIT (the dot that must
+already be visited before an endlinear dot can be reached). ENDLINEAR and MIDDLE hold the same information as readable
+tables, and the masks are derived from them. ADJACENT is kept only as reference data for the self-test.
 
 Running this script will do a self-test, then make a file called "allPatterns.txt" in the current directory, containing
 a new-line separated list of patterns.
 
+The fastest option is the C version of the search in enumerate.c, which is used if it has been built next to the script:
+
+$ cc -O2 -shared -fPIC -o enumerate.so enumerate.c
+
+Otherwise the search runs as plain Python, which takes about 0.2 s. A Numba-compiled version can be used instead by
+setting USE_NUMBA=1 in the environment (Numba and NumPy must be installed), but it is slower overall: the first run
+spends around 3 s compiling, and later runs still take about 0.7 s, mostly importing NumPy and Numba. All of these
+produce the same file.
+
 Future work could look at optimising the ordering in a more clever way than right now - the arrays here are tweaked
 to be in an order that tries to prioritise the more "likely" transitions. For example, 0 -> 5 is a valid transition, but
 it's a very hard one to enter, and very unlikely to see used.
@@ -33,249 +43,323 @@ $ wc -l allPatterns.txt
 
 """
 
-
-# Find out what points are adjacent to current one
-# Again, optimised replies to put more likely patterns first
-def getAdjacent(dot):
-    if (dot == 0):
-        return [1, 3, 4]
-    elif (dot == 1):
-        return [0, 2, 4, 3, 5]
-    elif (dot == 2):
-        return [1, 5, 4]
-    elif (dot == 3):
-        return [0, 6, 4, 1, 7]
-    elif (dot == 4):
-        return [1, 3, 5, 7, 0, 3, 6, 8]
-    elif (dot == 5):
-        return [2, 8, 4, 7, 1]
-    elif (dot == 6):
-        return [3, 7, 4]
-    elif (dot == 7):
-        return [6, 8, 4, 3, 5]
-    elif (dot == 8):
-        return [7, 5, 4]
-
-# Remember, linear ALSO includes adjacent! This is only for non-adjacent linear!
-# The replies are optimised to return the most likely combinations first.
-def getLinear(dot):
-    if (dot == 0):
-        return [1, 3, 4, 2, 6, 8]
-    elif (dot == 1):
-        return [4, 7]
-    elif (dot == 2):
-        return [1, 4, 5, 0, 6, 8]
-    elif (dot == 3):
-        return [4, 5]
-    elif (dot == 4):
-        return []
-    elif (dot == 5):
-        return [4, 3]
-    elif (dot == 6):
-        return [3, 4, 7, 0, 2, 8]
-    elif (dot == 7):
-        return [4, 1]
-    elif (dot == 8):
-        return [7, 5, 4, 6, 2, 0]
-
-# Finds linear dots which are at extremities of the grid
+import ctypes
+import os
+from array import array
+from functools import lru_cache
+from math import perm
+
+# The C version of the search is optional too - it is used if enumerate.so has been built next to this script (see
+# enumerate.c). A library which can't be loaded, or an old build without enumerate_patterns, is ignored
+try:
+    patternLib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "enumerate.so"))
+    patternLib.enumerate_patterns.argtypes = [ctypes.POINTER(ctypes.c_uint16), ctypes.c_int, ctypes.c_char_p,
+                                              ctypes.POINTER(ctypes.c_size_t)]
+    patternLib.enumerate_patterns.restype = ctypes.c_size_t
+except (OSError, AttributeError):
+    patternLib = None
+
+# Numba is optional and opt-in - set USE_NUMBA=1 in the environment to compile the search with it. It isn't used by
+# default because importing NumPy and Numba takes longer than the pure Python search, before counting the compile on
+# the first run. NumPy and Numba aren't imported at all when the C version is available
+njit = None
+if patternLib is None and os.environ.get("USE_NUMBA") == "1":
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        pass
+
+
+# The dots adjacent to each dot, indexed by dot. The rules don't use this (see DIRECT_MASK) - it is only kept as
+# reference data for the self-test
+ADJACENT = (
+    frozenset({1, 3, 4}),
+    frozenset({0, 2, 4, 3, 5}),
+    frozenset({1, 5, 4}),
+    frozenset({0, 6, 4, 1, 7}),
+    frozenset({1, 3, 5, 7, 0, 2, 6, 8}),
+    frozenset({2, 8, 4, 7, 1}),
+    frozenset({3, 7, 4}),
+    frozenset({6, 8, 4, 3, 5}),
+    frozenset({7, 5, 4}),
+)
+
+# Linear dots which are at extremities of the grid, indexed by dot
 # Remember, linear ALSO includes adjacent! This is only for non-adjacent linear!
 #
 # i.e.   for dot 0, the endlinear dots are 2 to the right, 2 below, and 2 below-left diagonally
-def getEndLinear(dot):
-    if (dot == 0):
-        return [2, 6, 8]
-    elif (dot == 1):
-        return [7]
-    elif (dot == 2):
-        return [0, 8, 6]
-    elif (dot == 3):
-        return [5]
-    elif (dot == 4):
-        return []
-    elif (dot == 5):
-        return [3]
-    elif (dot == 6):
-        return [0, 8, 2]
-    elif (dot == 7):
-        return [1]
-    elif (dot == 8):
-        return [6, 2, 0]
-
-# Finds the dot between any given "extremities" of the pattern grid
+ENDLINEAR = (
+    frozenset({2, 6, 8}),
+    frozenset({7}),
+    frozenset({0, 8, 6}),
+    frozenset({5}),
+    frozenset(),
+    frozenset({3}),
+    frozenset({0, 8, 2}),
+    frozenset({1}),
+    frozenset({6, 2, 0}),
+)
+
+# The dot between any given "extremities" of the pattern grid, keyed by the (lower, higher) pair of extremities
 #
 # i.e.   0    _    2
+# MIDDLE[(0, 2)] is 1
+MIDDLE = {(0, 2): 1, (0, 6): 3, (0, 8): 4, (1, 7): 4, (2, 6): 4, (2, 8): 5, (3, 5): 4, (6, 8): 7}
+
+# Finds the dot between any given "extremities" of the pattern grid
 # Invoking this on (0,2) or (2,0) will return 1
 def getMiddle(dot1, dot2):
-    # Half the combinations to consider by sorting these numerically
-    lower = min(dot1, dot2)
-    higher = max(dot1, dot2)
-    if (lower == 0 and higher == 2):
-        return 1
-    if (lower == 0 and higher == 6):
-        return 3
-    if (lower == 0 and higher == 8):
-        return 4
-    if (lower == 1 and higher == 7):
-        return 4
-    if (lower == 2 and higher == 6):
-        return 4
-    if (lower == 2 and higher == 8):
-        return 5
-    if (lower == 3 and higher == 5):
-        return 4
-    if (lower == 6 and higher == 8):
-        return 7
-
-# one-liner to check a dot hasn't already been visited in the current pattern
-def isAlreadyVisited(currentPattern, next):
-    return next in currentPattern
-
-# one-liner to fetch the most recent dot from the current pattern
-def getLast(currentPattern):
-    return currentPattern[len(currentPattern)-1]
-
-# Returns a list of dots which are permitted to feature next, for a given pattern passed in
-def getAllowedNextDots(currentPattern):
-    # dots already used are not eligible
-    # dots not in a line are not eligible
-    # dots not adjacent must "skip" a visited dot
-    allDots = [0, 1, 2, 3, 4, 5, 6, 7, 8]
-    candidateDots = allDots.copy()
-    for dot in allDots:
-        if isAlreadyVisited(currentPattern, dot):
-            # Remove as already visited
-            candidateDots.remove(dot)
-            continue
-        # reaching this point means the dot is NOT already visited
-
-        # now check if the point is adjacent - if it is, it's fine
-        if dot in getAdjacent(getLast(currentPattern)):
-            # the candidate dot is adjacent to the last dot, AND we know it's not visited before - it's OK
-            continue
-        # if it isn't adjacent, let's check if it's linear, AND that the adjacent is already visited
-
-        # if the dot is linear (skipping adjacent)
-        if dot in getEndLinear(getLast(currentPattern)):
-            # we can find the intersecting dot
-            intersect = getMiddle(dot, getLast(currentPattern))
-            if isAlreadyVisited(currentPattern, intersect):
-                # this is allowed
-                continue
-            else:
-                candidateDots.remove(dot)
-
-    # Now we have removed non-allowed dots
-    return candidateDots
+    return MIDDLE[(dot1, dot2) if dot1 < dot2 else (dot2, dot1)]
+
+# Bitmask of all nine dots; bit n is set when dot n is included
+ALL_DOTS = 0b111111111
+
+# Bitmask of each dot's endlinear dots
+ENDLIN_MASK = tuple(sum(1 << end for end in ENDLINEAR[dot]) for dot in range(9))
+
+# Bitmask of the dots which can always be reached directly from each dot (if not yet visited). This is every dot other
+# than itself and its endlinear dots - so the adjacent dots, plus the "knight's move" dots such as 0 -> 5
+DIRECT_MASK = tuple(ALL_DOTS & ~ENDLIN_MASK[dot] & ~(1 << dot) for dot in range(9))
+
+# MIDDLE_BIT[dot][end] is the bitmask of the dot between dot and one of its endlinear dots, or 0 if end isn't endlinear
+MIDDLE_BIT = tuple(tuple(1 << getMiddle(dot, end) if end in ENDLINEAR[dot] else 0 for end in range(9))
+                   for dot in range(9))
 
+# Builds the visited-dots bitmask for a pattern
+def getMask(pattern):
+    mask = 0
+    for dot in pattern:
+        mask |= 1 << dot
+    return mask
+
+# one-liner to check a dot hasn't already been visited, given the visited-dots bitmask
+def isAlreadyVisited(mask, next):
+    return (mask >> next) & 1
+
+# Returns the bitmask of dots which are permitted to feature next, given the last dot and the visited-dots bitmask
+def computeAllowedNextMask(last, mask):
+    # dots already used are not eligible
+    # dots not adjacent must "skip" a visited dot if they are linear
+    allowed = DIRECT_MASK[last] & ~mask
+    endLinear = ENDLIN_MASK[last] & ~mask
+    while endLinear:
+        bit = endLinear & -endLinear
+        # an endlinear dot is allowed once the dot in between is visited
+        if mask & MIDDLE_BIT[last][bit.bit_length() - 1]:
+            allowed |= bit
+        endLinear ^= bit
+    return allowed
+
+# There are only 9 x 512 possible (last, mask) states, so the allowed next dots for every one of them are worked out
+# once here. NEXT[last * 512 + mask] is the bitmask of dots permitted to feature next
+NEXT = array("H", (computeAllowedNextMask(last, mask) for last in range(9) for mask in range(ALL_DOTS + 1)))
+
+# Returns a tuple of dots which are permitted to feature next, given the last dot and the visited-dots bitmask. Only
+# test() calls this - the search reads NEXT directly - and the cache just saves rebuilding the tuple when test() asks
+# about the same pattern in a loop
+@lru_cache(maxsize=None)
+def getAllowedNextDots(last, mask):
+    allowed = NEXT[last * 512 + mask]
+    dots = []
+    while allowed:
+        # pull off the lowest set bit each time round
+        bit = allowed & -allowed
+        dots.append(bit.bit_length() - 1)
+        allowed ^= bit
+    return tuple(dots)
+
+# The 8 symmetries of the grid (rotations and reflections), as permutations - SYMMETRIES[n][dot] is where dot is moved
+# to. Each is written in terms of the row and column of the dot
+SYMMETRIES = tuple(tuple(move(*divmod(dot, 3)) for dot in range(9)) for move in (
+    lambda row, col: 3 * row + col,                 # identity
+    lambda row, col: 3 * col + (2 - row),           # rotate 90 clockwise
+    lambda row, col: 3 * (2 - row) + (2 - col),     # rotate 180
+    lambda row, col: 3 * (2 - col) + row,           # rotate 270 clockwise
+    lambda row, col: 3 * row + (2 - col),           # reflect left-right
+    lambda row, col: 3 * (2 - row) + col,           # reflect top-bottom
+    lambda row, col: 3 * col + row,                 # reflect in the 0-4-8 diagonal
+    lambda row, col: 3 * (2 - col) + (2 - row),     # reflect in the 2-4-6 diagonal
+))
+
+# Any symmetry of a valid pattern is also a valid pattern, so only patterns starting from 0 (a corner), 1 (an edge) and
+# 4 (the centre) need to be searched. The four rotations move 0 onto each corner and 1 onto each edge exactly once,
+# and the centre only needs the identity
+START_ORBITS = ((0, SYMMETRIES[:4]), (1, SYMMETRIES[:4]), (4, SYMMETRIES[:1]))
 
 # Include some automated self-tests to help ensure this works correctly. These do not aim to test every scenario; rather
 # they tested conditions needed while writing the code.
 def test():
     # The text at the end of an assertion is the "hint" stating what was wrong
-    assert 6 in getLinear(0), "0 and 6 are linear"
-    assert 5 not in getLinear(0), "0 and 5 are not linear"
-    pattern1 = [0, 1, 4]
+    assert 6 in ENDLINEAR[0], "0 and 6 are linear"
+    assert 5 not in ADJACENT[0] | ENDLINEAR[0], "0 and 5 are not linear"
+    assert getMiddle(8, 2) == 5, "5 is between 8 and 2"
+    pattern1 = getMask([0, 1, 4])
     assert isAlreadyVisited(pattern1, 1), "Already visited 1"
     assert not isAlreadyVisited(pattern1, 3), "Haven't already visited 3"
     testPattern = [0, 3, 6]
     for i in [1, 4, 7, 5]:
-        assert i in getAllowedNextDots(testPattern), "Dot should be allowed but wasn't"
+        assert i in getAllowedNextDots(6, getMask(testPattern)), "Dot should be allowed but wasn't"
     for i in [0, 2, 3, 6, 8]:
-        assert i not in getAllowedNextDots(testPattern), "Dot should not be allowed but was"
+        assert i not in getAllowedNextDots(6, getMask(testPattern)), "Dot should not be allowed but was"
 
     testPattern2 = [2, 1, 5, 4, 3, 0]
     for i in [6, 7, 8]:
-        assert i in getAllowedNextDots(testPattern2), "Dot should be allowed but wasn't"
+        assert i in getAllowedNextDots(0, getMask(testPattern2)), "Dot should be allowed but wasn't"
     for i in [2, 1, 5, 4, 3, 0]:
-        assert i not in getAllowedNextDots(testPattern2), "Dot should not be allowed but was"
+        assert i not in getAllowedNextDots(0, getMask(testPattern2)), "Dot should not be allowed but was"
 
     testPattern3 = [0, 7]
-    assert 4 in getAllowedNextDots(testPattern3), "Dot should be allowed but wasn't"
-    assert 1 not in getAllowedNextDots(testPattern3), "Dot should not be allowed but was"
+    assert 4 in getAllowedNextDots(7, getMask(testPattern3)), "Dot should be allowed but wasn't"
+    assert 1 not in getAllowedNextDots(7, getMask(testPattern3)), "Dot should not be allowed but was"
     testPattern4 = [0, 4, 7]
-    assert 1 in getAllowedNextDots(testPattern4), "Dot should be allowed but wasn't"
+    assert 1 in getAllowedNextDots(7, getMask(testPattern4)), "Dot should be allowed but wasn't"
+
+    # the rules must look the same after any symmetry, or searching only the START_ORBITS would miss patterns
+    # this is checked straight on the NEXT table, with each symmetry precomputed as a permutation of all 512 masks
+    for symmetry in SYMMETRIES:
+        moveMask = [getMask(symmetry[dot] for dot in range(9) if isAlreadyVisited(mask, dot)) for mask in range(512)]
+        for last in range(9):
+            for mask in range(512):
+                movedNext = NEXT[symmetry[last] * 512 + moveMask[mask]]
+                assert movedNext == moveMask[NEXT[last * 512 + mask]], "Rules should be symmetric"
 
 ########################################
 
-# Returns a list of the possible "next pattern"
-def getNextOptions(currentPattern):
-    allPatterns = []
-    x = getAllowedNextDots(currentPattern)
-    #print("Next options are: " + str(x))
-    #print(x)
-    for i in x:
-        candidate = currentPattern.copy()
-        candidate.append(i)
-        allPatterns.append(candidate)
-    #print(allPatterns)
-    return allPatterns
-
-# This is the core of the logic - find all patterns of a given length, starting with a given prefix
-def recursivelyEvaluate(patternStart, targetLength):
-    lstStart = []
-    # add the first digit of the pattern into the list
-    lstStart.append(patternStart)
-    # get the length of the current pattern
-    currentLength = len(lstStart)
-    if (len(lstStart) == 1):
-        # this is first iteration, define currentPattern
-        currentPattern = lstStart.copy()
-    # work out how many iterations are needed, based on how many more dots are needed
-    iterationsToDo = targetLength - currentLength
-
-    # for each iteration
-    for i in range(iterationsToDo):
-        #print("Iteration " + str(i))
-        # get a list of the possible next ones
-        if (i == 0):
-            # first time round, we get the list of possible patterns
-            nextOpts = getNextOptions(currentPattern)
-        else:
-            # after that, we make a list
-            nextOpts = []
-            # for each of the branches we've identified
-            for branch in currentPattern:
-                # add the branched possible options
-                nextOpts.extend(getNextOptions(branch))
-        # now update currentPattern for the next iteration of the loop
-        currentPattern = nextOpts
-    # return the array of possible patterns for this length
-    return currentPattern
-
-
-# For a given length, finds the set of all valid patterns
-def findAllPatterns(targetLength):
-    allPatterns = []
-    for i in range(9): # for each starting point
-        thisSet = recursivelyEvaluate(i, targetLength)
-        allPatterns.extend(thisSet)
-    return allPatterns
-
-# The main function - this will find all valid patterns upto a given length
-def findAllCombinations(maxLength):
-    allPatterns = []
+# This is the core of the logic - a depth-first search from the given pattern, up to the maximum length. The pattern is
+# held as ASCII digits in a single fixed-size path bytearray, where path[depth] is overwritten with each dot tried at
+# that depth, and the visited-dots bitmask is passed alongside it. Every prefix of a longer pattern is itself a pattern,
+# so each one of at least 4 dots is added to outByLength[depth] on the way down, rather than searching again for each
+# length. outByLength[depth] is a single bytearray of new-line separated patterns, so storing the results costs one
+# byte per digit rather than an object per pattern
+def dfs(last, mask, depth, path, maxLength, outByLength):
     # Patterns must be a minimum of 4 dots in length
+    if depth >= 4:
+        # the slot after the last dot is free until the next dot is tried, so the newline can go there
+        path[depth] = ord("\n")
+        outByLength[depth] += path[:depth + 1]
+    if depth == maxLength:
+        return
+    # walk the allowed dots straight off the NEXT table, rather than building a list of them first
+    allowed = NEXT[last * 512 + mask]
+    while allowed:
+        bit = allowed & -allowed
+        allowed ^= bit
+        nxt = bit.bit_length() - 1
+        path[depth] = ord("0") + nxt
+        dfs(nxt, mask | bit, depth + 1, path, maxLength, outByLength)
+
+
+# The main function - this will write all valid patterns upto a given length to out, shortest first, and return how
+# many there are
+def findAllCombinations(maxLength, out):
+    # for each starting point, the orbit's results and the symmetry which maps them onto that starting point
+    startMoves = [None] * 9
+    for start, symmetries in START_ORBITS:
+        orbitByLength = [bytearray() for i in range(maxLength + 1)]
+        # room for maxLength dots and the newline
+        path = bytearray(maxLength + 1)
+        path[0] = ord("0") + start
+        dfs(start, 1 << start, 1, path, maxLength, orbitByLength)
+        for symmetry in symmetries:
+            moveDots = bytes.maketrans(b"012345678", bytes(ord("0") + dot for dot in symmetry))
+            startMoves[symmetry[start]] = (orbitByLength, moveDots)
+    total = 0
+    for i in range(4,maxLength+1):
+        count = 0
+        for orbitByLength, moveDots in startMoves:
+            # map the patterns found onto this starting point, and sort them to keep the same order as searching from it
+            # directly. Only one starting point's patterns of one length are split out into a list at a time
+            patterns = bytes(orbitByLength[i]).translate(moveDots).split()
+            patterns.sort()
+            out.write(b"\n".join(patterns) + b"\n")
+            count += len(patterns)
+        print("Length = " + str(i) + ": " + str(count) + " patterns")
+        total += count
+    return total
+
+if njit is not None:
+    # The same search as dfs, compiled with Numba. Numba can't use Python lists, so this works with fixed-size arrays
+    # and an explicit stack rather than recursion - path[depth], masks[depth] and cursors[depth] are the dot, the
+    # visited-dots bitmask and the next candidate dot to try at each depth. Each pattern of at least 4 dots is copied
+    # into a row of patterns, with its length in lengths. Returns the number of patterns found
+    @njit(cache=True)
+    def compiledSearch(nextTable, maxLength, patterns, lengths):
+        path = np.zeros(9, np.uint8)
+        masks = np.zeros(9, np.int64)
+        cursors = np.zeros(9, np.int64)
+        count = 0
+        for start in range(9):
+            path[0] = start
+            masks[0] = 1 << start
+            cursors[0] = 0
+            depth = 0
+            while depth >= 0:
+                if depth + 1 == maxLength or cursors[depth] == 9:
+                    # nothing more to try from here, so go back up
+                    depth -= 1
+                    continue
+                dot = cursors[depth]
+                cursors[depth] += 1
+                if (nextTable[path[depth] * 512 + masks[depth]] >> dot) & 1:
+                    depth += 1
+                    path[depth] = dot
+                    masks[depth] = masks[depth - 1] | (1 << dot)
+                    cursors[depth] = 0
+                    # Patterns must be a minimum of 4 dots in length
+                    if depth + 1 >= 4:
+                        patterns[count, :] = path
+                        lengths[count] = depth + 1
+                        count += 1
+        return count
+
+    # As findAllCombinations, but using compiledSearch
+    def findAllCombinationsCompiled(maxLength, out):
+        # there can't be more patterns than there are arrangements of up to maxLength distinct dots
+        bound = sum(perm(9, i) for i in range(4, maxLength + 1))
+        patterns = np.zeros((bound, 9), np.uint8)
+        lengths = np.zeros(bound, np.uint8)
+        total = compiledSearch(np.array(NEXT, np.uint16), maxLength, patterns, lengths)
+        patterns = patterns[:total]
+        lengths = lengths[:total]
+        for i in range(4,maxLength+1):
+            # each search is in order, so picking out one length keeps it in order
+            thisSet = patterns[lengths == i, :i]
+            print("Length = " + str(i) + ": " + str(len(thisSet)) + " patterns")
+            lines = np.full((len(thisSet), i + 1), ord("\n"), np.uint8)
+            lines[:, :i] = thisSet + ord("0")
+            out.write(lines.tobytes())
+        return total
+
+
+# As findAllCombinations, but using enumerate_patterns from the C library, which writes the whole file into one buffer
+def findAllCombinationsC(maxLength, out):
+    # room for every arrangement of up to maxLength distinct dots, each with a newline
+    bound = sum(perm(9, i) * (i + 1) for i in range(4, maxLength + 1))
+    buffer = ctypes.create_string_buffer(bound)
+    counts = (ctypes.c_size_t * 10)()
+    nextTable = (ctypes.c_uint16 * len(NEXT)).from_buffer(NEXT)
+    size = patternLib.enumerate_patterns(nextTable, maxLength, buffer, counts)
+    if size == ctypes.c_size_t(-1).value:
+        raise ValueError("maxLength must be between 1 and 9")
     for i in range(4,maxLength+1):
-        # For each pattern length, find all valid patterns for that length
-        thisSet = findAllPatterns(i)
-        print("Length = " + str(i) + ": " + str(len(thisSet)) + " patterns")
-        # Now add these patterns into the overall set of all patterns
-        allPatterns.extend(thisSet)
-    return allPatterns
+        print("Length = " + str(i) + ": " + str(counts[i]) + " patterns")
+    out.write(memoryview(buffer)[:size])
+    return sum(counts)
 
 
 ############################
 # The part to do the actual work
 # First run the little self-test
 test()
-# Now find all combinations of up-to 9 dots in length
-x = findAllCombinations(9)
-print("Total number: " + str(len(x)))
-f = open("allPatterns.txt", "w")
-for pattern in x:
-    toWrite = ""
-    for result in pattern:
-        toWrite += str(result)
-    f.write(str(toWrite) + "\n")
+# Now find all combinations of up-to 9 dots in length, and write them out in binary mode, with a large buffer so they
+# go out in a handful of big writes
+f = open("allPatterns.txt", "wb", buffering=1 << 20)
+if patternLib is not None:
+    x = findAllCombinationsC(9, f)
+elif njit is not None:
+    x = findAllCombinationsCompiled(9, f)
+else:
+    x = findAllCombinations(9, f)
 f.close()
+print("Total number: " + str(x))